@@ -0,0 +1,40 @@
+"""
+This script chains the registered validations into a pipeline that shares
+one uploaded file and one thread.
+
+Usage: python assistants/validation_pipeline.py [validation_name ...]
+Without arguments, every registered validation is run.
+
+Note: Export the 'API_KEY' and ensure the CSV file is present.
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules import api_exception_handler, validation_executor, validation_registry
+from assistants import validations
+
+API_KEY = os.getenv("API_KEY")
+EXECUTOR = validation_executor.ValidationExecutor(API_KEY)
+
+
+def perform_validation_pipeline(names):
+    """
+    Run the given validations as one pipeline and print the result of each
+    """
+    try:
+        results = EXECUTOR.run_pipeline(
+            names,
+            file_name=validations.FILE_NAME,
+            data=validations.DATASET,
+        )
+    except api_exception_handler.FrameworkError as error:
+        print("Error while running validation pipeline:", error)
+        sys.exit(1)
+
+    for name, result in results.items():
+        print(f"\n{name}: ", result)
+
+
+if __name__ == "__main__":
+    perform_validation_pipeline(sys.argv[1:] or validation_registry.list_validations())
@@ -0,0 +1,70 @@
+"""
+This script declares the data validations performed by OpenAI AI Assistants.
+Importing it registers the validations, which are run by the ValidationExecutor.
+"""
+import csv
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.validation_registry import (
+    FILE_INPUT,
+    INLINE_INPUT,
+    ValidationDefinition,
+    register_validation,
+)
+
+NUMERICAL_VALIDATION = "numerical_validation"
+OUTLIER_DETECTION = "outlier_detection"
+
+# Sample inputs validated by the example scripts
+FILE_NAME = "utils/github_scores.csv"
+DATASET = [60, 128, 128, 128, 128, 128, 128, 128, 128, 128, 110, 128, 128, 128, 128, 128, 128,
+           128, 128, 128, 30, 128, 128, 128, 128, 128, 128, 128, 128, 128]
+
+
+def check_scores_locally(file_name, _data):
+    """
+    Check locally whether all repo_score values in the CSV file are between 0 and 1
+    """
+    failed_values = []
+    with open(file_name, newline="", encoding="utf-8-sig") as csv_file:
+        for row in csv.DictReader(csv_file):
+            score = float(row["repo_score"])
+            if not 0.0 <= score <= 1.0:
+                failed_values.append({"repo_score": score, "repo_name": row["repo_name"]})
+    return {"valid": not failed_values, "failed_values": failed_values}
+
+
+register_validation(ValidationDefinition(
+    name=NUMERICAL_VALIDATION,
+    assistant_name="Numerical Validation Assistant",
+    instructions="""
+    You are an expert in numerical data validation. You will be provided a CSV file having 2 columns - repo_score and repo_name.
+    The values of the repo_score column are floating point numbers. Your task is to verify that all the numbers in this repo_score column
+    meet the following condition:
+     - All values must be between 0 and 1 (inclusive) i.e each value must be greater than or equal to 0.0 and less than or equal to 1.0
+
+    Return a JSON object with two keys:
+    1. "valid": true if the dataset meets the criteria, false otherwise
+    2. "failed_values": a list containing numbers along with repo names that do not satisfy the condition
+    """,
+    prompt="Validate the provided CSV file and give out the results",
+    input_type=FILE_INPUT,
+    file_columns=["repo_score", "repo_name"],
+    fast_path=check_scores_locally,
+    result_keys=["valid", "failed_values"],
+))
+
+register_validation(ValidationDefinition(
+    name=OUTLIER_DETECTION,
+    assistant_name="Outler Detection Assistant",
+    instructions='''
+    You are an expert in outlier data validation. You will be provided a dataset with numbers (integer or floating point).
+    Your task is to identify potential outliers in the dataset or distribution of numbers.
+    Outliers are values that lie outside the overall pattern in a distribution.
+    When asked question consisting of the dataset of numbers, identify the outliers and provide it to the user.
+    ''',
+    prompt="Identify the outliers in this dataset - {data}",
+    input_type=INLINE_INPUT,
+))
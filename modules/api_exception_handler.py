@@ -4,146 +4,134 @@ assistant-related operations.
 """
 
 import time
-from openai import BadRequestError, APIError, RateLimitError, AuthenticationError
+from email.utils import parsedate_to_datetime
+from openai import APIConnectionError, APIError, APIStatusError
 
-class AssistantError(Exception):
+# HTTP status codes of requests that may succeed when retried
+RETRYABLE_STATUS_CODES = frozenset((408, 409, 429, 500, 502, 503, 504))
+
+
+class FrameworkError(Exception):
+    """
+    The base class of the framework exceptions. It carries the details of the
+    error that caused it, which is also chained as its __cause__.
+
+    Attributes:
+        status_code (int): The HTTP status code of the failed request, if any.
+        request_id (str): The ID of the failed request, if any.
+        retry_after (float): The time to wait before retrying in seconds, if given.
+        retryable (bool): Whether retrying the call may succeed.
+    """
+    __slots__ = ("status_code", "request_id", "retry_after", "retryable")
+
+    def __init__(self, message, status_code=None, request_id=None,
+                 retry_after=None, retryable=False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.request_id = request_id
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+    def __reduce__(self):
+        return (self.__class__, (str(self), self.status_code, self.request_id,
+                                 self.retry_after, self.retryable))
+
+    @classmethod
+    def from_exception(cls, error):
+        """
+        Creates an exception holding the details of the given error.
+        Args:
+            error (Exception): The error raised by the OpenAI API or the standard library.
+        Returns:
+            FrameworkError: The structured exception, to be raised from the error.
+        """
+        if isinstance(error, APIStatusError):
+            headers = error.response.headers
+            return cls(
+                str(error),
+                status_code=error.status_code,
+                request_id=getattr(error, "request_id", None) or headers.get("x-request-id"),
+                retry_after=_parse_retry_after(headers),
+                retryable=error.status_code in RETRYABLE_STATUS_CODES,
+            )
+        retryable = isinstance(error, (APIConnectionError, TimeoutError))
+        return cls(str(error), retryable=retryable)
+
+class AssistantError(FrameworkError):
     "To raise exceptions generated while handling assistants"
+    __slots__ = ()
 
-class FileError(Exception):
+class FileError(FrameworkError):
     "To raise exceptions generated while handling files"
+    __slots__ = ()
 
-class MessageError(Exception):
+class MessageError(FrameworkError):
     "To raise exceptions generated while handling messages"
+    __slots__ = ()
 
-class RunError(Exception):
+class RunError(FrameworkError):
     "To raise exceptions generated while handling runs"
+    __slots__ = ()
 
-class ThreadError(Exception):
+class ThreadError(FrameworkError):
     "To raise exceptions generated while handling threads"
+    __slots__ = ()
 
-def assistant_exception_handler(func):
-    """
-    A decorator function that handles OpenAI API errors that might arise when using assistant methods.
-    Args:
-        func: The function that calls the OpenAI API methods related to assistants.
-    Returns:
-        function: The wrapped function that handles the OpenAI API errors.
-    Raises:
-        AssistantError: A custom exception class that wraps the OpenAI API errors.
-    """
-    def inner_function(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except BadRequestError as request_error:
-            raise AssistantError(request_error)
-        except RateLimitError as rate_error:
-            raise AssistantError(rate_error)
-        except AuthenticationError as auth_error:
-            raise AssistantError(auth_error)
-        except APIError as api_error:
-            raise AssistantError(api_error)
-    return inner_function
-
-def file_exception_handler(func):
-    """
-    A decorator function that handles OpenAI API errors that might arise when using file methods.
-    Args:
-        func (function): The function that calls the OpenAI API methods related to files.
-    Returns:
-        function: The wrapped function that handles the OpenAI API errors.
-    Raises:
-        FileError: A custom exception class that wraps the OpenAI API errors.
-    """
-    def inner_function(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except FileNotFoundError as file_not_found_error:
-            raise FileError(file_not_found_error)
-        except RateLimitError as rate_error:
-            raise FileError(rate_error)
-        except AuthenticationError as auth_error:
-            raise FileError(auth_error)
-        except APIError as api_error:
-            raise FileError(api_error)
-        except PermissionError as permission_error:
-            raise FileError(permission_error)
-        except TimeoutError as time_out_error:
-            time.sleep(5)
-            func(*args, **kwargs)
-            raise FileError(time_out_error)
-        except ValueError as value_error:
-            raise FileError(value_error)
-    return inner_function
-
-def message_exception_handler(func):
-    """
-    A decorator function that handles OpenAI API errors that might arise when using message methods.
-    Args:
-        func (function): The function that calls the OpenAI API methods related to messages.
-    Returns:
-        function: The wrapped function that handles the OpenAI API errors.
-    Raises:
-        MessageError: A custom exception class that wraps the OpenAI API errors.
-    """
-    def inner_function(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except BadRequestError as request_error:
-            raise MessageError(request_error)
-        except RateLimitError as rate_error:
-            raise MessageError(rate_error)
-        except AuthenticationError as auth_error:
-            raise MessageError(auth_error)
-        except APIError as api_error:
-            raise MessageError(api_error)
-    return inner_function
-
-def thread_exception_handler(func):
+class ValidationError(FrameworkError):
+    "To raise exceptions generated while running validations"
+    __slots__ = ()
+
+def _parse_retry_after(headers):
     """
-    A decorator function that handles OpenAI API errors that might arise when using thread methods.
-    Args:
-        func (function): The function that calls the OpenAI API methods related to threads.
-    Returns:
-        function: The wrapped function that handles the OpenAI API errors.
-    Raises:
-        ThreadError: A custom exception class that wraps the OpenAI API errors.
+    Returns the time to wait before retrying from the response headers, in seconds.
     """
-    def inner_function(*args, **kwargs):
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
         try:
-            return func(*args, **kwargs)
-        except BadRequestError as request_error:
-            raise ThreadError(request_error)
-        except RateLimitError as rate_error:
-            raise ThreadError(rate_error)
-        except AuthenticationError as auth_error:
-            raise ThreadError(auth_error)
-        except APIError as api_error:
-            raise ThreadError(api_error)
-    return inner_function
-
-def run_exception_handler(func):
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def exception_handler(error_class, handled_errors):
     """
-    A decorator function that handles OpenAI API errors that might arise when using run methods.
+    A decorator factory that wraps the handled errors in a structured framework exception.
+    Only a try block is added to the successful path; the error details are
+    extracted when an error is raised.
     Args:
-        func (function): The function that calls the OpenAI API methods related to run.
+        error_class (type): The FrameworkError subclass raised for the handled errors.
+        handled_errors (tuple): The exception types to wrap.
     Returns:
-        function: The wrapped function that handles the OpenAI API errors.
+        function: The decorator wrapping a function with the exception handling.
     Raises:
-        RunError: A custom exception class that wraps the OpenAI API errors.
+        FrameworkError: The error_class exception, chained to the original error.
     """
-    def inner_function(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except BadRequestError as request_error:
-            raise RunError(request_error)
-        except RateLimitError as rate_error:
-            raise RunError(rate_error)
-        except AuthenticationError as auth_error:
-            raise RunError(auth_error)
-        except APIError as api_error:
-            raise RunError(api_error)
-        except PermissionError as permission_error:
-            raise RunError(permission_error)
-        except TimeoutError as timeout_error:
-            raise RunError(timeout_error)
-    return inner_function
+    def decorator(func):
+        def inner_function(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except handled_errors as error:
+                raise error_class.from_exception(error) from error
+        return inner_function
+    return decorator
+
+# BadRequestError, RateLimitError and AuthenticationError are subclasses of APIError
+assistant_exception_handler = exception_handler(AssistantError, (APIError,))
+file_exception_handler = exception_handler(
+    FileError, (APIError, FileNotFoundError, PermissionError, TimeoutError, ValueError)
+)
+message_exception_handler = exception_handler(MessageError, (APIError,))
+thread_exception_handler = exception_handler(ThreadError, (APIError,))
+run_exception_handler = exception_handler(
+    RunError, (APIError, PermissionError, TimeoutError)
+)
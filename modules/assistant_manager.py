@@ -4,6 +4,12 @@ and deleting assistants using the OpenAI API.
 """
 from openai import OpenAI
 from .api_exception_handler import assistant_exception_handler
+from .single_flight import SINGLE_FLIGHT, single_flight_handler
+
+
+def _retrieve_assistant_key(manager, assistant_id):
+    "Key identifying identical retrieve_assistant calls"
+    return ("retrieve_assistant", manager.client.api_key, assistant_id)
 
 
 class AssistantManager:
@@ -58,6 +64,7 @@ class AssistantManager:
         return assistants_list.data
 
     @assistant_exception_handler
+    @single_flight_handler(_retrieve_assistant_key)
     def retrieve_assistant(self, assistant_id):
         """
         Retrieves an assistant by its ID.
@@ -71,19 +78,34 @@ class AssistantManager:
         )
         return retrieved_assistant
 
+    async def retrieve_assistant_async(self, assistant_id):
+        """
+        Retrieves an assistant by its ID without blocking the event loop.
+        Concurrent identical calls share one request.
+        Args:
+            assistant_id (str): The ID of the assistant.
+        Returns:
+            dict: The retrieved assistant object.
+        """
+        return await SINGLE_FLIGHT.do_async(
+            _retrieve_assistant_key(self, assistant_id), self.retrieve_assistant, assistant_id
+        )
+
     @assistant_exception_handler
     def retrieve_assistant_using_name(self, assistant_name):
         """
-        Retrieves an assistant by its name.
+        Retrieves the most recent assistant with the given name.
+        Every page of assistants is searched until one matches.
         Args:
             assistant_name (str): The name of the assistant.
         Returns:
-            dict: The retrieved assistant object.
+            dict: The retrieved assistant object, or None if no assistant has this name.
         """
-        available_assistant = self.client.beta.assistants.retrieve(
-            assistant_name=assistant_name
-        )
-        return available_assistant
+        # Iterating over the page fetches the following pages as needed
+        for assistant in self.client.beta.assistants.list(order="desc", limit=100):
+            if assistant.name == assistant_name:
+                return assistant
+        return None
 
     @assistant_exception_handler
     def delete_assistant(self, assistant_id):
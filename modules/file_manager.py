@@ -1,8 +1,28 @@
 """
 This script provides methods for uploading and listing files using the OpenAI API.
+It also provides a method for writing a compact copy of a CSV dataset before upload.
 """
+import csv
+import os
+import shutil
+import tempfile
 from openai import OpenAI
 from .api_exception_handler import file_exception_handler
+from .single_flight import SINGLE_FLIGHT, single_flight_handler
+
+
+def _upload_file_key(manager, file_name):
+    "Key identifying uploads of the same, unchanged file"
+    stat = os.stat(file_name)
+    return ("upload_file", manager.client.api_key, os.path.abspath(file_name),
+            stat.st_size, stat.st_mtime_ns)
+
+
+def _upload_compact_file_key(manager, file_name, columns=None, drop_duplicates=False):
+    "Key identifying compact uploads of the same, unchanged file"
+    stat = os.stat(file_name)
+    return ("upload_compact_file", manager.client.api_key, os.path.abspath(file_name),
+            stat.st_size, stat.st_mtime_ns, tuple(columns or ()), drop_duplicates)
 
 
 class FileManager:
@@ -19,6 +39,7 @@ class FileManager:
         self.client = OpenAI(api_key=api_key)
 
     @file_exception_handler
+    @single_flight_handler(_upload_file_key)
     def upload_file(self, file_name):
         """
         Uploads a file to the OpenAI API and returns the file ID.
@@ -27,12 +48,121 @@ class FileManager:
         Returns:
         - str: The ID of the uploaded file.
         """
-        file = self.client.files.create(
-            file=open(file_name, "rb"),
-            purpose="assistants"
-        )
+        with open(file_name, "rb") as file_handle:
+            file = self.client.files.create(
+                file=file_handle,
+                purpose="assistants"
+            )
         return file.id
 
+    async def upload_file_async(self, file_name):
+        """
+        Uploads a file to the OpenAI API without blocking the event loop.
+        Concurrent uploads of the same, unchanged file share one request.
+        Args:
+        - file_name (str): The name of the file to upload.
+        Returns:
+        - str: The ID of the uploaded file.
+        """
+        return await SINGLE_FLIGHT.do_async(
+            _upload_file_key(self, file_name), self.upload_file, file_name
+        )
+
+    @file_exception_handler
+    def compact_file(self, file_name, columns=None, drop_duplicates=False, output_dir=None):
+        """
+        Writes a compact CSV copy of a CSV file.
+        Only the requested columns are kept, values are written with minimal
+        quoting and, optionally, duplicate rows are dropped. The copy keeps the
+        .csv extension, which the code_interpreter tool accepts.
+        Args:
+        - file_name (str): The name of the CSV file to compact.
+        - columns (list, optional): The columns to keep. Defaults to all columns.
+        - drop_duplicates (bool, optional): Whether to drop repeated rows. Defaults to False.
+        - output_dir (str, optional): The directory for the compact file.
+          Defaults to a new temporary directory.
+        Returns:
+        - str: The path of the compact file.
+        """
+        # utf-8-sig drops the byte order mark written by tools such as Excel
+        with open(file_name, newline="", encoding="utf-8-sig") as source:
+            reader = csv.reader(source)
+            header = next(reader, None)
+            if header is None:
+                raise ValueError(f"{file_name} is empty, a header row is required")
+            columns = columns or header
+            missing = [column for column in columns if column not in header]
+            if missing:
+                raise ValueError(f"Columns not found in {file_name}: {missing}")
+            indices = [header.index(column) for column in columns]
+
+            created_dir = output_dir is None
+            output_dir = output_dir or tempfile.mkdtemp(prefix="compact_")
+            base_name = os.path.splitext(os.path.basename(file_name))[0]
+            compact_name = os.path.join(output_dir, f"{base_name}.csv")
+            if os.path.abspath(compact_name) == os.path.abspath(file_name):
+                raise ValueError(f"The compact copy would overwrite {file_name}")
+            try:
+                self._write_compact_rows(reader, compact_name, columns, indices, drop_duplicates)
+            except IndexError:
+                self._remove_compact_file(compact_name, created_dir)
+                raise ValueError(
+                    f"Row {reader.line_num} of {file_name} has fewer than {len(header)} columns"
+                ) from None
+            except BaseException:
+                self._remove_compact_file(compact_name, created_dir)
+                raise
+        return compact_name
+
+    @staticmethod
+    def _write_compact_rows(reader, compact_name, columns, indices, drop_duplicates):
+        """
+        Writes the projected rows of the reader to the compact file.
+        """
+        seen_rows = set()
+        with open(compact_name, "w", newline="", encoding="utf-8") as target:
+            writer = csv.writer(target, quoting=csv.QUOTE_MINIMAL)
+            writer.writerow(columns)
+            for row in reader:
+                # Blank lines are skipped, as csv.DictReader and pandas do
+                if not row:
+                    continue
+                projected = tuple(row[index] for index in indices)
+                if drop_duplicates:
+                    if projected in seen_rows:
+                        continue
+                    seen_rows.add(projected)
+                writer.writerow(projected)
+
+    @staticmethod
+    def _remove_compact_file(compact_name, remove_dir=True):
+        """
+        Removes a compact file and, if requested, the temporary directory holding it.
+        """
+        if remove_dir:
+            shutil.rmtree(os.path.dirname(compact_name), ignore_errors=True)
+        elif os.path.exists(compact_name):
+            os.remove(compact_name)
+
+    @file_exception_handler
+    @single_flight_handler(_upload_compact_file_key)
+    def upload_compact_file(self, file_name, columns=None, drop_duplicates=False):
+        """
+        Compacts a CSV file and uploads the compact copy to the OpenAI API.
+        Concurrent compact uploads of the same, unchanged file share one request.
+        Args:
+        - file_name (str): The name of the CSV file to upload.
+        - columns (list, optional): The columns to keep. Defaults to all columns.
+        - drop_duplicates (bool, optional): Whether to drop repeated rows. Defaults to False.
+        Returns:
+        - str: The ID of the uploaded file.
+        """
+        compact_name = self.compact_file(file_name, columns, drop_duplicates)
+        try:
+            return self.upload_file(compact_name)
+        finally:
+            self._remove_compact_file(compact_name)
+
     @file_exception_handler
     def list_files(self):
         """
@@ -73,16 +73,30 @@ class MessageManager:
         return messages
 
     @message_exception_handler
-    def process_message(self, thread_id):
+    def get_latest_response(self, thread_id):
         """
-        Processes the latest message in a thread.
+        Returns the text of the latest message in a thread.
         Args:
             thread_id (str): The ID of the thread.
+        Returns:
+            str: The text of the latest message, or None if the thread has no messages.
         """
         messages = self.list_messages_by_thread(thread_id)
 
         if messages.data:
-            latest_response = messages.data[0].content[0].text.value
+            return messages.data[0].content[0].text.value
+        return None
+
+    @message_exception_handler
+    def process_message(self, thread_id):
+        """
+        Processes the latest message in a thread.
+        Args:
+            thread_id (str): The ID of the thread.
+        """
+        latest_response = self.get_latest_response(thread_id)
+
+        if latest_response is not None:
             print("\nAssistant: ", latest_response)
         else:
             print("No messages found.")
@@ -1,9 +1,26 @@
 """
-This script provides methods for creating, retrieving, 
+This script provides methods for creating, retrieving, cancelling
 and submitting tool outputs for runs using the OpenAI API.
+It also provides a method for waiting on a run with a deadline and optional hedging.
 """
+import time
+from collections import deque
 from openai import OpenAI
-from .api_exception_handler import run_exception_handler
+from .api_exception_handler import run_exception_handler, RunError
+from .single_flight import SINGLE_FLIGHT, single_flight_handler
+
+# A run in one of these states will not change any further
+TERMINAL_STATUSES = ("completed", "failed", "cancelled", "expired")
+# Number of observed queue times needed before the hedging percentile is trusted
+MIN_QUEUE_SAMPLES = 20
+# Number of most recent queue times kept for the hedging percentile
+MAX_QUEUE_SAMPLES = 500
+
+
+def _retrieve_run_key(manager, thread_id, run_id):
+    "Key identifying identical retrieve_run_status calls"
+    return ("retrieve_run_status", manager.client.api_key, thread_id, run_id)
+
 
 class RunManager:
     """
@@ -12,7 +29,9 @@ class RunManager:
         api_key (str): The API key for accessing the OpenAI API.
     Attributes:
         client: An instance of the OpenAI class for making API calls.
-        runs: A dictionary to store information about the runs.
+        runs: A dictionary of the queue time of the most recently recorded runs, by run ID.
+        queue_times: A list of observed times (in seconds) runs spent in the queue
+        by the runs this instance waited for.
     """
 
     def __init__(self, api_key: str):
@@ -23,6 +42,7 @@ class RunManager:
         """
         self.client = OpenAI(api_key=api_key)
         self.runs = {}
+        self.queue_times = deque(maxlen=MAX_QUEUE_SAMPLES)
 
     @run_exception_handler
     def run_assistant(self, thread_id, assistant_id, instructions=None):
@@ -43,6 +63,30 @@ class RunManager:
         return run
 
     @run_exception_handler
+    def create_thread_and_run(self, assistant_id, content, file_ids=None, instructions=None):
+        """
+        Creates a new thread with a user message and runs an assistant on it.
+        Args:
+            assistant_id (str): The ID of the assistant.
+            content (str): The content of the user message.
+            file_ids (list, optional): The IDs of the files attached to the message.
+            Defaults to None.
+            instructions (str, optional): The instructions for the assistant. Defaults to None.
+        Returns:
+            dict: The run object, its thread_id is the ID of the new thread.
+        """
+        message = {"role": "user", "content": content}
+        if file_ids:
+            message["file_ids"] = file_ids
+        run = self.client.beta.threads.create_and_run(
+            assistant_id=assistant_id,
+            thread={"messages": [message]},
+            instructions=instructions
+        )
+        return run
+
+    @run_exception_handler
+    @single_flight_handler(_retrieve_run_key)
     def retrieve_run_status(self, thread_id, run_id):
         """
         Retrieves the status of a run and returns the status object.
@@ -57,6 +101,21 @@ class RunManager:
             run_id=run_id
         )
 
+    async def retrieve_run_status_async(self, thread_id, run_id):
+        """
+        Retrieves the status of a run without blocking the event loop.
+        Concurrent identical calls share one request.
+        Args:
+            thread_id (str): The ID of the thread.
+            run_id (str): The ID of the run.
+        Returns:
+            dict: The status object.
+        """
+        return await SINGLE_FLIGHT.do_async(
+            _retrieve_run_key(self, thread_id, run_id),
+            self.retrieve_run_status, thread_id, run_id
+        )
+
     @run_exception_handler
     def submit_run_output(self, thread_id, run_id, tool_outputs):
         """
@@ -71,3 +130,122 @@ class RunManager:
             run_id=run_id,
             tool_outputs=tool_outputs
         )
+
+    @run_exception_handler
+    def cancel_run(self, thread_id, run_id):
+        """
+        Cancels a run that is queued or in progress.
+        Args:
+            thread_id (str): The ID of the thread.
+            run_id (str): The ID of the run.
+        Returns:
+            dict: The run object.
+        """
+        return self.client.beta.threads.runs.cancel(
+            thread_id=thread_id,
+            run_id=run_id
+        )
+
+    def queue_time_percentile(self, percentile):
+        """
+        Returns the given percentile of the observed queue times.
+        Args:
+            percentile (float): The percentile, between 0 and 100.
+        Returns:
+            float: The queue time in seconds, or None if too few runs were observed.
+        """
+        if len(self.queue_times) < MIN_QUEUE_SAMPLES:
+            return None
+        ordered = sorted(self.queue_times)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    @run_exception_handler
+    def wait_for_run(self, thread_id, run_id, deadline=None, poll_interval=5,
+                     hedge=None, hedge_percentile=95, hedge_after=30):
+        """
+        Polls a run until it reaches a terminal status or requires action.
+        If the deadline is exceeded, every run started for the request is cancelled.
+        With hedging enabled, a run that stays queued longer than the given percentile
+        of the observed queue times gets a duplicate run; whichever run completes
+        first is returned and the other one is cancelled.
+        Args:
+            thread_id (str): The ID of the thread.
+            run_id (str): The ID of the run.
+            deadline (float, optional): The maximum time to wait in seconds. Defaults to None.
+            poll_interval (float, optional): The time between status checks in seconds.
+            Defaults to 5.
+            hedge (callable, optional): Starts a duplicate run on a fresh thread and returns
+            the run object. Defaults to None, which disables hedging.
+            hedge_percentile (float, optional): The queue time percentile after which the
+            duplicate run is started. Defaults to 95.
+            hedge_after (float, optional): The queue time used until MIN_QUEUE_SAMPLES
+            queue times have been observed. Defaults to 30. Queue times are kept per
+            RunManager, so a short-lived script always hedges after this time; only a
+            long-lived RunManager reaches the percentile.
+        Returns:
+            dict: The run object of the winning run.
+        Raises:
+            TimeoutError: If the deadline is exceeded.
+        """
+        start = time.monotonic()
+        hedge_threshold = self.queue_time_percentile(hedge_percentile)
+        if hedge_threshold is None:
+            hedge_threshold = hedge_after
+        active = {run_id: thread_id}
+        finished = None
+
+        try:
+            while True:
+                for active_run_id, active_thread_id in list(active.items()):
+                    run = self.retrieve_run_status(
+                        thread_id=active_thread_id, run_id=active_run_id
+                    )
+                    if run.status != "queued" and getattr(run, "started_at", None):
+                        self._record_queue_time(run)
+                    if run.status == "completed" or run.status == "requires_action":
+                        del active[active_run_id]
+                        self._cancel_runs(active)
+                        return run
+                    if run.status in TERMINAL_STATUSES:
+                        del active[active_run_id]
+                        finished = run
+                    elif (hedge is not None and len(active) == 1 and run.status == "queued"
+                          and time.time() - run.created_at > hedge_threshold):
+                        hedged_run = hedge()
+                        active[hedged_run.id] = hedged_run.thread_id
+                        hedge = None
+
+                if not active:
+                    return finished
+                elapsed = time.monotonic() - start
+                if deadline is not None and elapsed >= deadline:
+                    raise TimeoutError(f"Run {run_id} did not finish within {deadline} seconds")
+                wait = poll_interval if deadline is None else min(poll_interval, deadline - elapsed)
+                time.sleep(wait)
+        except BaseException:
+            # Never leave a run going on the server once nobody waits for it
+            self._cancel_runs(active)
+            raise
+
+    def _record_queue_time(self, run):
+        """
+        Records how long a run spent in the queue, once per run.
+        Only the MAX_QUEUE_SAMPLES most recent run IDs are remembered.
+        """
+        if run.id not in self.runs:
+            queue_time = run.started_at - run.created_at
+            self.runs[run.id] = queue_time
+            self.queue_times.append(queue_time)
+            if len(self.runs) > MAX_QUEUE_SAMPLES:
+                del self.runs[next(iter(self.runs))]
+
+    def _cancel_runs(self, active):
+        """
+        Cancels the given runs, ignoring runs that finished in the meantime.
+        """
+        for run_id, thread_id in active.items():
+            try:
+                self.cancel_run(thread_id=thread_id, run_id=run_id)
+            except RunError:
+                pass
@@ -0,0 +1,144 @@
+"""
+This module provides a single-flight layer that collapses concurrent identical
+calls into one upstream request and fans its result out to every waiting caller.
+It supports both threads and asyncio.
+"""
+import asyncio
+import functools
+import threading
+
+
+def _copy_error(error):
+    """
+    Returns a shallow copy of an exception with an empty traceback, so every
+    waiting caller raises its own exception instead of sharing one object.
+    """
+    error_class = type(error)
+    copied = error_class.__new__(error_class, *error.args)
+    copied.args = error.args
+    copied.__dict__.update(error.__dict__)
+    for klass in error_class.__mro__:
+        slots = getattr(klass, "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if hasattr(error, slot):
+                setattr(copied, slot, getattr(error, slot))
+    if isinstance(error, OSError):
+        # The file names of an OSError are not part of its args
+        copied.filename = error.filename
+        if error.filename2 is not None:
+            copied.filename2 = error.filename2
+    copied.__cause__ = error.__cause__
+    copied.__suppress_context__ = error.__suppress_context__
+    return copied
+
+
+class _Call:
+    "An in-flight call whose result is shared by every caller with the same key"
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    A class that runs at most one call per key at a time.
+    Callers arriving while a call with the same key is in flight wait for it and
+    receive its result (or its exception) instead of making their own call.
+    """
+
+    def __init__(self):
+        """
+        Initializes the SingleFlight instance with no calls in flight.
+        """
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._futures = {}
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Runs func unless a call with the same key is already in flight.
+        Args:
+            key (hashable): The key identifying identical calls.
+            func (function): The function making the upstream request.
+        Returns:
+            The result of the in-flight call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise _copy_error(call.error)
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, func, *args, **kwargs):
+        """
+        Awaits func unless a call with the same key is already in flight on this event loop.
+        A plain function is run in the default executor so it does not block the loop.
+        Args:
+            key (hashable): The key identifying identical calls.
+            func (function): The function or coroutine function making the upstream request.
+        Returns:
+            The result of the in-flight call.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        future = self._futures.get(loop_key)
+        if future is None or future.done():
+            if asyncio.iscoroutinefunction(func):
+                future = asyncio.ensure_future(func(*args, **kwargs))
+            else:
+                future = loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+            self._futures[loop_key] = future
+            future.add_done_callback(functools.partial(self._forget, loop_key))
+        # Waiting instead of awaiting the future means one cancelled waiter does not
+        # cancel the call for the others, and the shared exception is never re-raised
+        await asyncio.wait((future,))
+        if future.cancelled():
+            raise asyncio.CancelledError()
+        if future.exception() is not None:
+            raise _copy_error(future.exception())
+        return future.result()
+
+    def _forget(self, loop_key, future):
+        """
+        Removes a finished async call, unless a newer call has replaced it.
+        """
+        if self._futures.get(loop_key) is future:
+            del self._futures[loop_key]
+
+
+SINGLE_FLIGHT = SingleFlight()
+
+
+def single_flight_handler(key_func):
+    """
+    A decorator function that collapses concurrent identical calls of a manager method.
+    Args:
+        key_func (function): Builds the key identifying identical calls from the
+        arguments of the decorated method.
+    Returns:
+        function: The decorator wrapping the method with the single-flight layer.
+    """
+    def decorator(func):
+        def inner_function(*args, **kwargs):
+            return SINGLE_FLIGHT.do(key_func(*args, **kwargs), func, *args, **kwargs)
+        return inner_function
+    return decorator
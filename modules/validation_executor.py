@@ -0,0 +1,237 @@
+"""
+This script provides a generic executor for the validations declared in the
+validation registry. Validations can be run alone or chained into a pipeline
+that shares one uploaded file and one thread.
+"""
+import json
+import time
+from .api_exception_handler import ValidationError
+from .assistant_manager import AssistantManager
+from .file_manager import FileManager
+from .message_manager import MessageManager
+from .run_manager import RunManager
+from .thread_manager import ThreadManager
+from .validation_registry import FILE_INPUT, INLINE_INPUT, get_validation
+
+
+class ValidationExecutor:
+    """
+    A class that runs registered validations using OpenAI assistants.
+
+    Args:
+        api_key (str): The API key for accessing the OpenAI API.
+    Attributes:
+        assistant_ids: A dictionary that caches the assistant ID of each validation.
+    """
+
+    def __init__(self, api_key: str, deadline=300, hedge=False, use_fast_path=False):
+        """
+        Initializes the ValidationExecutor instance with an API key.
+        Args:
+            api_key (str): The API key for accessing the OpenAI API.
+            deadline (float, optional): The maximum time in seconds for a whole validation
+            or pipeline, shared by all its steps. Defaults to 300.
+            hedge (bool, optional): Whether runs that stay queued get a duplicate run on a
+            fresh thread. This may double the cost of a run. Defaults to False.
+            use_fast_path (bool, optional): Whether validations with a local fast-path are
+            validated locally instead of by the assistant. Defaults to False.
+        """
+        self.assistant_manager = AssistantManager(api_key)
+        self.file_manager = FileManager(api_key)
+        self.message_manager = MessageManager(api_key)
+        self.run_manager = RunManager(api_key)
+        self.thread_manager = ThreadManager(api_key)
+        self.deadline = deadline
+        self.hedge = hedge
+        self.use_fast_path = use_fast_path
+        self.assistant_ids = {}
+
+    def resolve_assistant(self, definition):
+        """
+        Returns the ID of the assistant performing a validation. The assistant is
+        looked up by its name and created if it does not exist yet.
+        Args:
+            definition (ValidationDefinition): The validation.
+        Returns:
+            str: The ID of the assistant.
+        """
+        if definition.name in self.assistant_ids:
+            return self.assistant_ids[definition.name]
+
+        assistant_id = definition.assistant_id
+        if assistant_id is None:
+            assistant = self.assistant_manager.retrieve_assistant_using_name(
+                definition.assistant_name
+            )
+            assistant_id = assistant.id if assistant is not None else None
+        if assistant_id is None:
+            assistant_id = self.assistant_manager.create_assistant(
+                definition.assistant_name, definition.instructions, definition.tools
+            ).id
+        self.assistant_ids[definition.name] = assistant_id
+        return assistant_id
+
+    def run_validation(self, name, file_name=None, data=None):
+        """
+        Runs a single registered validation.
+        Args:
+            name (str): The name of the validation.
+            file_name (str, optional): The file validated by file input validations.
+            data (optional): The data validated by inline input validations.
+        Returns:
+            The result of the validation.
+        """
+        return self.run_pipeline([name], file_name=file_name, data=data)[name]
+
+    def run_pipeline(self, names, file_name=None, data=None):
+        """
+        Runs several registered validations in order. The file is uploaded once
+        and all the validations run on the same thread, which is deleted afterwards.
+        All the steps share one deadline, checked before each API call.
+        Args:
+            names (list): The names of the validations.
+            file_name (str, optional): The file validated by file input validations.
+            data (optional): The data validated by inline input validations.
+        Returns:
+            dict: The result of each validation, keyed by its name.
+        Raises:
+            ValidationError: If a validation fails to run or returns an invalid result.
+        """
+        deadline_at = time.monotonic() + self.deadline
+        definitions = [get_validation(name) for name in names]
+        self._check_inputs(definitions, file_name, data)
+        results = {}
+        pending = []
+        for definition in definitions:
+            if self.use_fast_path and definition.fast_path is not None:
+                try:
+                    result = definition.fast_path(file_name, data)
+                except Exception as error:
+                    raise ValidationError(
+                        f"Local validation of {definition.name} failed: {error!r}"
+                    ) from error
+                if result is not None:
+                    results[definition.name] = result
+                    continue
+            pending.append(definition)
+
+        if pending:
+            self._time_left(deadline_at, "uploading the file")
+            file_id = self._upload_shared_file(pending, file_name)
+            self._time_left(deadline_at, "creating the thread")
+            thread_ids = [self.thread_manager.create_thread().id]
+            try:
+                for definition in pending:
+                    results[definition.name] = self._run_step(
+                        definition, thread_ids, file_id, data, deadline_at
+                    )
+            finally:
+                for thread_id in thread_ids:
+                    self.thread_manager.delete_thread(thread_id=thread_id)
+
+        return {definition.name: results[definition.name] for definition in definitions}
+
+    def _time_left(self, deadline_at, stage):
+        """
+        Returns the time left before the deadline, raising if it has passed.
+        """
+        time_left = deadline_at - time.monotonic()
+        if time_left <= 0:
+            raise ValidationError(
+                f"Deadline of {self.deadline} seconds exceeded before {stage}", retryable=True
+            )
+        return time_left
+
+    @staticmethod
+    def _check_inputs(definitions, file_name, data):
+        """
+        Checks that the input of every validation was provided, before any of them runs.
+        """
+        file_steps = [definition.name for definition in definitions
+                      if definition.input_type == FILE_INPUT]
+        if file_steps and file_name is None:
+            raise ValidationError(f"A file is required by: {file_steps}")
+        inline_steps = [definition.name for definition in definitions
+                        if definition.input_type == INLINE_INPUT]
+        if inline_steps and data is None:
+            raise ValidationError(f"Data is required by: {inline_steps}")
+
+    def _upload_shared_file(self, definitions, file_name):
+        """
+        Uploads one compact copy of the file holding the columns of every file input step.
+        """
+        file_steps = [definition for definition in definitions
+                      if definition.input_type == FILE_INPUT]
+        if not file_steps:
+            return None
+
+        columns = []
+        for definition in file_steps:
+            if definition.file_columns is None:
+                columns = None
+                break
+            columns += [column for column in definition.file_columns if column not in columns]
+        return self.file_manager.upload_compact_file(file_name, columns=columns)
+
+    def _run_step(self, definition, thread_ids, file_id, data, deadline_at):
+        """
+        Runs one validation on the shared thread, thread_ids[0], and returns its parsed result.
+        A hedged run is started on a fresh thread, which is added to thread_ids.
+        If the hedged run wins, its thread becomes the shared thread for the next steps,
+        since the cancelled run may still be active on the previous one.
+        """
+        self._time_left(deadline_at, f"running {definition.name}")
+        assistant_id = self.resolve_assistant(definition)
+        content = definition.prompt.replace("{data}", str(data))
+        file_ids = [file_id] if definition.input_type == FILE_INPUT else None
+
+        if file_ids:
+            self.message_manager.add_message_and_file_to_thread(
+                thread_id=thread_ids[0], content=content, file_id=file_id
+            )
+        else:
+            self.message_manager.add_message_to_thread(thread_id=thread_ids[0], content=content)
+        self._time_left(deadline_at, f"starting the run of {definition.name}")
+        run = self.run_manager.run_assistant(thread_id=thread_ids[0], assistant_id=assistant_id)
+
+        def hedge_run():
+            hedged_run = self.run_manager.create_thread_and_run(
+                assistant_id=assistant_id, content=content, file_ids=file_ids
+            )
+            thread_ids.append(hedged_run.thread_id)
+            return hedged_run
+
+        run = self.run_manager.wait_for_run(
+            thread_id=thread_ids[0],
+            run_id=run.id,
+            deadline=self._time_left(deadline_at, f"waiting for {definition.name}"),
+            hedge=hedge_run if self.hedge else None
+        )
+        if run.status != "completed":
+            raise ValidationError(f"Run of {definition.name} ended with status {run.status}")
+        if run.thread_id != thread_ids[0]:
+            thread_ids.remove(run.thread_id)
+            thread_ids.insert(0, run.thread_id)
+
+        response = self.message_manager.get_latest_response(run.thread_id)
+        return self._parse_result(definition, response)
+
+    @staticmethod
+    def _parse_result(definition, response):
+        """
+        Extracts the JSON object from the response and checks it holds the result keys.
+        """
+        if not definition.result_keys:
+            return response
+        start = (response or "").find("{")
+        end = (response or "").rfind("}")
+        try:
+            result = json.loads(response[start:end + 1]) if start != -1 else None
+        except json.JSONDecodeError:
+            result = None
+        if not isinstance(result, dict):
+            raise ValidationError(f"No JSON result in response of {definition.name}: {response}")
+        missing = [key for key in definition.result_keys if key not in result]
+        if missing:
+            raise ValidationError(f"Result of {definition.name} is missing keys: {missing}")
+        return result
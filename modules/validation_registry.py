@@ -0,0 +1,106 @@
+"""
+This script provides a registry of declarative validation definitions.
+A validation is described once as config (name, instructions, tools, input type,
+local fast-path and result schema) and run by the ValidationExecutor.
+"""
+from .api_exception_handler import ValidationError
+
+FILE_INPUT = "file"
+INLINE_INPUT = "inline"
+
+VALIDATIONS = {}
+
+
+class ValidationDefinition:
+    """
+    A class that describes a validation performed by an OpenAI assistant.
+
+    Attributes:
+        name (str): The unique name of the validation.
+        assistant_name (str): The name of the assistant performing the validation.
+        instructions (str): The instructions for the assistant.
+        prompt (str): The message sent to the assistant. For inline input,
+        "{data}" is replaced with the data being validated.
+        tools (list): The list of tools for the assistant.
+        input_type (str): FILE_INPUT if the data is uploaded as a file,
+        INLINE_INPUT if it is sent in the message.
+        file_columns (list): The columns kept when compacting a file input.
+        fast_path (callable): Validates the data locally, receives the file name and
+        the inline data and returns the result, or None to fall back to the assistant.
+        result_keys (list): The keys the JSON result must contain.
+        assistant_id (str): The ID of an existing assistant to use.
+    """
+
+    def __init__(self, name, assistant_name, instructions, prompt,
+                 tools=None, input_type=FILE_INPUT, file_columns=None,
+                 fast_path=None, result_keys=None, assistant_id=None):
+        """
+        Initializes the ValidationDefinition instance.
+        Args:
+            name (str): The unique name of the validation.
+            assistant_name (str): The name of the assistant performing the validation.
+            instructions (str): The instructions for the assistant.
+            prompt (str): The message sent to the assistant.
+            tools (list, optional): The list of tools for the assistant.
+            Defaults to the code_interpreter tool.
+            input_type (str, optional): FILE_INPUT or INLINE_INPUT. Defaults to FILE_INPUT.
+            file_columns (list, optional): The columns kept for file input. Defaults to all.
+            fast_path (callable, optional): The local validation. Defaults to None.
+            result_keys (list, optional): The keys of the JSON result. Defaults to None,
+            which accepts a free text result.
+            assistant_id (str, optional): The ID of an existing assistant. Defaults to None,
+            which looks the assistant up by name or creates it.
+        """
+        if input_type not in (FILE_INPUT, INLINE_INPUT):
+            raise ValidationError(f"Unknown input type for {name}: {input_type}")
+        self.name = name
+        self.assistant_name = assistant_name
+        self.instructions = instructions
+        self.prompt = prompt
+        self.tools = tools or [{"type": "code_interpreter"}]
+        self.input_type = input_type
+        self.file_columns = file_columns
+        self.fast_path = fast_path
+        self.result_keys = result_keys
+        self.assistant_id = assistant_id
+
+
+def register_validation(definition):
+    """
+    Adds a validation definition to the registry.
+    Args:
+        definition (ValidationDefinition): The validation to register.
+    Returns:
+        ValidationDefinition: The registered validation.
+    Raises:
+        ValidationError: If a validation with the same name is already registered.
+    """
+    if definition.name in VALIDATIONS:
+        raise ValidationError(f"Validation already registered: {definition.name}")
+    VALIDATIONS[definition.name] = definition
+    return definition
+
+
+def get_validation(name):
+    """
+    Retrieves a validation definition by its name.
+    Args:
+        name (str): The name of the validation.
+    Returns:
+        ValidationDefinition: The registered validation.
+    Raises:
+        ValidationError: If no validation with this name is registered.
+    """
+    try:
+        return VALIDATIONS[name]
+    except KeyError:
+        raise ValidationError(f"Unknown validation: {name}") from None
+
+
+def list_validations():
+    """
+    Lists the names of all registered validations.
+    Returns:
+        list: The names of the registered validations.
+    """
+    return list(VALIDATIONS)
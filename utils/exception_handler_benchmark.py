@@ -0,0 +1,57 @@
+"""
+This script measures the per-call overhead of the exception handler decorator
+on the successful path and the cost of wrapping an error on the failure path.
+
+Usage: python utils/exception_handler_benchmark.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules import api_exception_handler
+
+NUMBER = 200000
+REPEAT = 5
+
+
+def succeed():
+    "A call that returns without raising"
+    return None
+
+
+def fail():
+    "A call that raises an error handled by the run exception handler"
+    raise TimeoutError("Run did not finish")
+
+
+def wrapped_fail():
+    "Call fail through the run exception handler, swallowing the wrapped error"
+    try:
+        handled_fail()
+    except api_exception_handler.RunError:
+        pass
+
+
+handled_succeed = api_exception_handler.run_exception_handler(succeed)
+handled_fail = api_exception_handler.run_exception_handler(fail)
+
+
+def best_time(func):
+    "Return the best time per call in nanoseconds"
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def run_benchmark():
+    """
+    Print the time per call of a bare call, a decorated call and a wrapped error
+    """
+    bare = best_time(succeed)
+    handled = best_time(handled_succeed)
+    print(f"bare call:        {bare:8.1f} ns")
+    print(f"decorated call:   {handled:8.1f} ns ({handled - bare:+.1f} ns overhead)")
+    print(f"wrapped error:    {best_time(wrapped_fail):8.1f} ns")
+
+
+if __name__ == "__main__":
+    run_benchmark()
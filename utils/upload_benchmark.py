@@ -0,0 +1,98 @@
+"""
+This script compares uploading the original CSV dataset against uploading its
+compact copy (projected columns, minimal quoting).
+
+It always reports the upload size in bytes. When 'API_KEY' is exported it also
+measures the upload latency, and when 'ASSISTANT_ID' is exported as well it
+measures the run time of a numerical validation run on each uploaded file.
+
+Usage: python utils/upload_benchmark.py
+"""
+import os
+import shutil
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules import (
+    file_manager,
+    message_manager,
+    run_manager,
+    thread_manager,
+)
+
+API_KEY = os.getenv("API_KEY")
+ASSISTANT_ID = os.getenv("ASSISTANT_ID")
+FILE_NAME = "utils/github_scores.csv"
+COLUMNS = ["repo_score", "repo_name"]
+REPEAT = 3
+# Maximum time in seconds to wait for a validation run before it is cancelled
+RUN_DEADLINE = 300
+
+
+def measure_upload(manager, file_name):
+    """
+    Upload a file REPEAT times and return the file IDs and the mean latency in seconds
+    """
+    file_ids = []
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        file_ids.append(manager.upload_file(file_name))
+    return file_ids, (time.perf_counter() - start) / REPEAT
+
+
+def measure_run(file_id):
+    """
+    Run the numerical validation assistant on an uploaded file and return the final
+    status of the run and its run time in seconds
+    """
+    threads = thread_manager.ThreadManager(API_KEY)
+    messages = message_manager.MessageManager(API_KEY)
+    runs = run_manager.RunManager(API_KEY)
+
+    thread_id = threads.create_thread().id
+    try:
+        messages.add_message_and_file_to_thread(
+            thread_id=thread_id,
+            content="Validate the provided CSV file and give out the results",
+            file_id=file_id,
+        )
+        start = time.perf_counter()
+        run_id = runs.run_assistant(thread_id=thread_id, assistant_id=ASSISTANT_ID).id
+        run = runs.wait_for_run(
+            thread_id=thread_id, run_id=run_id, deadline=RUN_DEADLINE, poll_interval=1
+        )
+        return run.status, time.perf_counter() - start
+    finally:
+        threads.delete_thread(thread_id=thread_id)
+
+
+def run_benchmark():
+    """
+    Print upload bytes, upload latency and run time for the original and compact files
+    """
+    manager = file_manager.FileManager(API_KEY or "offline")
+    compact_name = manager.compact_file(FILE_NAME, COLUMNS)
+    candidates = {"original": FILE_NAME, "compact": compact_name}
+
+    try:
+        for label, path in candidates.items():
+            print(f"{label:>8}: {os.path.getsize(path)} bytes")
+            if not API_KEY:
+                continue
+            file_ids, latency = measure_upload(manager, path)
+            print(f"{label:>8}: {latency * 1000:.1f} ms mean upload latency")
+            if ASSISTANT_ID:
+                status, run_time = measure_run(file_ids[0])
+                if status == "completed":
+                    print(f"{label:>8}: {run_time:.1f} s run time")
+                else:
+                    print(f"{label:>8}: run {status} after {run_time:.1f} s, no run time measured")
+            for file_id in file_ids:
+                manager.client.files.delete(file_id)
+    finally:
+        shutil.rmtree(os.path.dirname(compact_name))
+
+
+if __name__ == "__main__":
+    run_benchmark()